@@ -31,16 +31,18 @@ from .drr import DRR
 @click.option('--mbh', default=4.3e6, help="Massive black Hole mass [solar mass]", show_default=True)
 @click.option('--rh', default=2.0, help="Radius of influence [pc]", show_default=True)
 @click.option('--threads', default=1, help="Number of threads", show_default=True)
+@click.option('--nproc', default=1, help="Number of processes vegas uses to evaluate the integrand", show_default=True)
 @click.option('--neval', default=1e4, help="Maximum number of evaluation pass to the Vegas integrator", show_default=True)
 @click.option('--plot', is_flag=True, help="Plot the results into NAME.eps", show_default=True)
 @click.option('--no_pbar', is_flag=True, help="Suppress progress bar")
 @click.option('--j_grid', default=128, help="Size of the gird in j=J/J_c space. The grid is evenly spaced on log "
                                             "scale between J_lc/J_c and 1", show_default=True)
-def main(name, sma, l_max, gamma, mstar, mbh, rh, threads, neval, plot,
-         no_pbar, j_grid):
+def main(name, sma, l_max, gamma, mstar, mbh, rh, threads, nproc, neval,
+         plot, no_pbar, j_grid):
     drr = DRR(sma, gamma=gamma, mbh_mass=mbh, star_mass=mstar, rh=rh, j_grid_size=j_grid)
 
-    d_rr, d_err = drr(l_max, threads=threads, neval=neval, progress_bar=not no_pbar)
+    d_rr, d_err = drr(l_max, threads=threads, nproc=nproc, neval=neval,
+                      progress_bar=not no_pbar)
     drr.save(name + '.hdf5')
     if plot:
         import matplotlib.pyplot as plt
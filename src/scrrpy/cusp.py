@@ -62,6 +62,7 @@ class Cusp(object):
         self.rh = float(rh)
         self.gr_factor = 1.0
         self.mu = 1.0
+        self._inv_cum_a_exp = 1 / (3 - self.gamma)
 
     @property
     def rg(self):
@@ -241,7 +242,7 @@ class Cusp(object):
         >>> print("{:0.10}, {:0.10}, {:0.10}".format(sma.min(), sma.mean(), sma.max()))
         0.03430996478, 1.147418232, 1.987320281
         """
-        return x ** (1 / (3 - self.gamma)) * self.rh
+        return x ** self._inv_cum_a_exp * self.rh
 
     def _nu_mass0(self, a):
         r"""
@@ -12,19 +12,31 @@ from builtins import range
 from builtins import super
 from builtins import zip
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
 from functools import lru_cache
+from itertools import repeat
 
+import gvar
 import h5py
 import numpy as np
 # noinspection PyPackageRequirements
 import progressbar
 import vegas
-from numba import jit
+from numba import config
+from numba import njit
+from numba import prange
 from numpy import mod
 from numpy import sqrt
+
 from scipy import special
 
 from . import Cusp
+from .utils import interp_sorted_semilogx
+
+# The multiprocessing paths fork after the jit kernels have already run
+# in the parent, so numba's threading layer has to survive a fork.
+config.THREADING_LAYER = 'workqueue'
 
 Res = namedtuple('Res', ('l', 'n', 'np', 'neval'))
 
@@ -92,17 +104,38 @@ class DRR(Cusp):
     def omega(self, omega):
         self._omega = omega
 
-    @lru_cache()
     def _res_intrp(self, ratio):
-        return ResInterp(self, self.omega * ratio, self.gr_factor)
-
-    def _integrand(self, j, sma_p, j_p, lnnp, true_anomaly):
-        d_nu_p = abs(self.d_nu_p(sma_p, j_p))
-        a2_int = a2_integrand(self.sma, j, sma_p, j_p, lnnp, true_anomaly)
-        return j_p * a2_int / d_nu_p
-
-    def __call__(self, l_max, neval=1e3, threads=1,
-                 progress_bar=True, seed=None):
+        r"""
+        The resonance interpolation grid for an exact rational
+        :math:`n/n^{\prime}` `ratio`, cached on the instance so
+        equivalent resonances (e.g. :math:`2/4` and :math:`1/2`) share
+        one grid and the cache dies with the instance.
+        """
+        try:
+            cache = self._res_intrp_cache
+        except AttributeError:
+            cache = self._res_intrp_cache = {}
+        try:
+            return cache[ratio]
+        except KeyError:
+            intrp = ResInterp(self, self.omega * float(ratio),
+                              self.gr_factor)
+            cache[ratio] = intrp
+            return intrp
+
+    def _integrand(self, j, sma_p, j_p, lnnp, true_anomaly, out=None):
+        # samples with j_p <= 0 lie outside the resonant domain; the
+        # kernel zeroes them, so only the precession derivative needs a
+        # safe stand-in value
+        d_nu_p = abs(self.d_nu_p(sma_p, np.where(j_p > 0, j_p, 0.5)))
+        a2_int = a2_integrand(self.sma, j, sma_p, j_p, lnnp, true_anomaly,
+                              out=out)
+        a2_int *= j_p
+        a2_int /= d_nu_p
+        return a2_int
+
+    def __call__(self, l_max, neval=1e3, threads=1, nproc=1, beta=0.75,
+                 batched=False, progress_bar=True, seed=None):
         r"""
         Returns the RR diffusion coefficient :math:`D_{JJ}/J_{\mathrm{c}}^2` [1/yr].
 
@@ -116,7 +149,29 @@ class DRR(Cusp):
             Default: 1000
         threads : int
             Number of parallel threads to use.
+            Each thread computes a different :math:`j` grid point.
             Default: 1 (no parallelization)
+        nproc : int
+            Number of processes `vegas` uses to evaluate the integrand
+            within a single integration. Multiplies with ``threads``,
+            so it is mostly useful when ``threads == 1``.
+            Default: 1 (no parallelization)
+        beta : float
+            Damping parameter of `vegas`'s adaptive stratified sampling
+            (VEGAS+). Set to 0 to fall back to importance sampling only.
+            Default: 0.75
+        batched : bool
+            Experimental. Integrate all :math:`j` grid points at once
+            with a single vector-valued `vegas` integration per
+            resonance instead of one integration per grid point. The
+            sampling overhead is amortized over the grid, but all grid
+            points share one importance map which cannot focus on every
+            resonance locus at once: grid points whose resonant region
+            differs from the dominant ones can be severely
+            underestimated and their reported errors are unreliable.
+            Use only for quick qualitative scans at fixed `neval`.
+            ``threads`` is ignored in this mode.
+            Default: ``False``
         progress_bar : bool
             Show progress bar.
             Default: ``True``
@@ -135,11 +190,11 @@ class DRR(Cusp):
         else:
             pbar = range(len(lnnp))
 
-        for i in pbar:
-            self._drr_lnnp(*lnnp[i], neval=neval, threads=threads)
+        results = [self._drr_lnnp(*lnnp[i], neval=neval, threads=threads,
+                                  nproc=nproc, beta=beta, batched=batched)
+                   for i in pbar]
 
-        drr = np.vstack([self._drr_lnnp(*lnnp, neval=neval, threads=threads)[0]
-                         for lnnp in lnnp])
+        drr = np.vstack([res[0] for res in results])
 
         # Remove non-physical values
         drr[drr < 0] = 0
@@ -147,12 +202,11 @@ class DRR(Cusp):
         # sum all resonances
         drr = drr.sum(axis=0)
 
-        drr_err = sqrt(sum(self._drr_lnnp(*lnnp, neval=neval,
-                                          threads=threads)[-1] ** 2
-                           for lnnp in lnnp))
+        drr_err = sqrt(sum(res[-1] ** 2 for res in results))
         return drr, drr_err
 
-    def _drr_lnnp(self, l, n, n_p, neval=1e3, threads=1):
+    def _drr_lnnp(self, l, n, n_p, neval=1e3, threads=1, nproc=1,
+                  beta=0.75, batched=False):
         r"""
         Calculates the :math:`(l,n,n_p)` term of the diffusion coefficient
         """
@@ -168,42 +222,40 @@ class DRR(Cusp):
         except KeyError:
             pass
 
-        ratio = n / n_p
-        self._res_intrp(ratio)
+        self._res_intrp(_canonical_ratio((l, n, n_p)))
+
+        if batched:
+            # the experimental batched estimates are never cached: they
+            # must not shadow the accurate per-point values under the
+            # same key, nor be persisted to disk by save()
+            return self._drr_batched((l, n, n_p), neval=neval,
+                                     nproc=nproc, beta=beta)
+
+        tr_map = self._train_map(l, n, n_p, neval=neval, beta=beta)
 
         if threads > 1:
-            queue = mp.Queue()
+            global _parallel_drr
+            _parallel_drr = self
+            try:
+                with ProcessPoolExecutor(
+                        max_workers=threads,
+                        mp_context=mp.get_context('fork')) as executor:
+                    results = list(executor.map(
+                        _drr_worker,
+                        zip(self.j, self.omega, self.seeds,
+                            repeat((l, n, n_p)), repeat(neval),
+                            repeat(nproc), repeat(beta),
+                            repeat(tr_map)),
+                        chunksize=max(1, self.j.size // threads)))
+            finally:
+                _parallel_drr = None
 
-            def parallel_drr(pos, j_s, omega_s, seed_s):
-                _results = [
-                    self._drr(j, omega, (l, n, n_p), neval=neval, seed=seed)
-                    for j, omega, seed in zip(j_s, omega_s, seed_s)
-                ]
-                _drr = [result[0] for result in _results]
-                _drr_err = [result[-1] for result in _results]
-                queue.put((pos, (_drr, _drr_err)))
-
-            js = [self.j[i::threads] for i in range(threads)]
-            omegas = [self.omega[i::threads] for i in range(threads)]
-            seeds = [self.seeds[i::threads] for i in range(threads)]
-
-            processes = [
-                mp.Process(target=parallel_drr, args=(i, j_s, omega_s, seed_s))
-                for i, (j_s, omega_s, seed_s) in
-                enumerate(zip(js, omegas, seeds))]
-            for process in processes:
-                process.start()
-            for process in processes:
-                process.join()
-
-            drr, drr_err = zip(*[(drr, drr_err)
-                                 for (i, (drr, drr_err)) in
-                                 sorted(map(queue.get, processes))])
-            drr, drr_err = (np.concatenate(list(zip(*drr))),
-                            np.concatenate(list(zip(*drr_err))))
+            drr, drr_err = np.array(list(zip(*results)))
 
         else:
-            results = [self._drr(j, omega, (l, n, n_p), neval=neval, seed=seed)
+            results = [self._drr(j, omega, (l, n, n_p), neval=neval,
+                                 seed=seed, nproc=nproc, beta=beta,
+                                 tr_map=tr_map)
                        for j, omega, seed in
                        zip(self.j, self.omega, self.seeds)]
 
@@ -213,40 +265,89 @@ class DRR(Cusp):
 
         return drr, drr_err
 
-    def _drr(self, j, omega, lnnp, neval=1e3, seed=None):
+    def _train_map(self, l, n, n_p, neval=1e3, beta=0.75):
+        r"""
+        Adapt an importance map on the first resonant :math:`j` grid
+        point. Neighboring grid points produce similar integrands, so the
+        map is reused as the starting map for all of them, shortening
+        their per-point warm-up.
+        """
+        neval = int(neval)
+        ratio = float(_canonical_ratio((l, n, n_p)))
+        res_intrp = self._res_intrp(_canonical_ratio((l, n, n_p)))
+        for j, omega in zip(self.j, self.omega):
+            get_jf = res_intrp(omega * ratio)
+            if get_jf is not None:
+                break
+        else:
+            return None
+        gvar.ranseed((self.seed, l, n, 2 * l + n_p))
+        # beta > 0 turns on vegas's adaptive stratified sampling (VEGAS+)
+        integ = vegas.Integrator(5 * [[0, 1]], beta=beta)
+        integ(_Clnnp(self, j, get_jf, (l, n, n_p)), nitn=10,
+              neval=max(neval // 4, 100))
+        return integ.map.extract_grid()
+
+    def _drr_batched(self, lnnp, neval=1e3, nproc=1, beta=0.75):
+        r"""
+        Calculates the :math:`(l,n,n_p)` term on the whole :math:`j`
+        grid with a single `vegas` integration of a vector integrand.
+        The sampled field-star orbits are shared by all grid points.
+        """
+        l, n, n_p = lnnp
+        ratio = _canonical_ratio(lnnp)
+        res_intrp = self._res_intrp(ratio)
+        get_jfs = [res_intrp(omega * float(ratio)) for omega in self.omega]
+        if all(get_jf is None for get_jf in get_jfs):
+            return np.zeros(self.j.size), np.zeros(self.j.size)
+        np.random.seed([self.seed, l, n, 2 * l + n_p])
+        gvar.ranseed((self.seed, l, n, 2 * l + n_p))
+        integ = vegas.Integrator(5 * [[0, 1]], beta=beta)
+        func = _ClnnpVector(self, get_jfs, lnnp)
+        res, err = integrate(func, integ, neval, nproc=nproc)
+        norm = self._norm_factor(lnnp)
+        return res * norm, err * norm
+
+    def _norm_factor(self, lnnp):
+        r"""
+        Normalization of the :math:`(l,n,n_p)` term [1/yr]
+        """
+        l, n, n_p = lnnp
+        return (8 * np.pi * n ** 2 / abs(n_p) *
+                _a2_norm_factor(*lnnp) *
+                self.nu_r(self.sma) ** 2 / self.mass_ratio ** 2 *
+                self.total_number_of_stars)
+
+    def _drr(self, j, omega, lnnp, neval=1e3, seed=None, nproc=1,
+             beta=0.75, tr_map=None):
         l, n, n_p = lnnp
-        ratio = n / n_p
-        get_jf = self._res_intrp(ratio)(omega * ratio)
+        ratio = _canonical_ratio(lnnp)
+        get_jf = self._res_intrp(ratio)(omega * float(ratio))
         if seed is not None:
             # make a unique seed
             np.random.seed([seed, l, n, 2 * l + n_p])
+            # vegas draws its random numbers from gvar's generator
+            gvar.ranseed((seed, l, n, 2 * l + n_p))
 
-        pi = np.pi
-
-        @vegas.batchintegrand
-        def c_lnnp(x):
-            true_anomaly = x[:, :-1].T * pi
-            sma_f = self.inverse_cumulative_a(x[:, -1])
-            jf = get_jf(sma_f)
-            res = np.zeros(x.shape[0], float)
-            ix = np.where(jf > 0)[0]
-            if len(ix) > 0:
-                res[ix] = self._integrand(j, sma_f[ix], jf[ix], lnnp,
-                                          true_anomaly[:, ix])
-            return res
-
+        c_lnnp = _Clnnp(self, j, get_jf, lnnp)
         self.c_lnnp = c_lnnp
-        integ = vegas.Integrator(5 * [[0, 1]])
+        if tr_map is None:
+            # beta > 0 turns on vegas's adaptive stratified sampling (VEGAS+)
+            integ = vegas.Integrator(5 * [[0, 1]], beta=beta)
+            nitn_warmup = 5
+        else:
+            # start from a copy of the pre-trained map so every grid
+            # point adapts independently of the others
+            integ = vegas.Integrator(vegas.AdaptiveMap(tr_map), beta=beta)
+            nitn_warmup = 2
 
         if get_jf is None:
             result = np.zeros(2)
         else:
-            result = np.array(integrate(c_lnnp, integ, neval))
+            result = np.array(integrate(c_lnnp, integ, neval, nproc=nproc,
+                                        nitn_warmup=nitn_warmup))
 
-        return result * (8 * pi * n ** 2 / abs(n_p) *
-                         _a2_norm_factor(*lnnp) *
-                         self.nu_r(self.sma) ** 2 / self.mass_ratio ** 2 *
-                         self.total_number_of_stars)
+        return result * self._norm_factor(lnnp)
 
     @property
     def l_max(self):
@@ -294,13 +395,13 @@ class DRR(Cusp):
 
             for key, value in h5['_drr_lnnp_cache'].items():
                 try:
-                    self._drr_lnnp_cache[Res(**make_dict(key))] = value.value
+                    self._drr_lnnp_cache[Res(**make_dict(key))] = value[()]
                 except AttributeError:
-                    self._drr_lnnp_cache = {Res(**make_dict(key)): value.value}
+                    self._drr_lnnp_cache = {Res(**make_dict(key)): value[()]}
 
             for key, value in h5.items():
                 if key != '_drr_lnnp_cache':
-                    setattr(self, key, value.value)
+                    setattr(self, key, value[()])
 
     @classmethod
     def from_file(cls, file_name):
@@ -319,10 +420,116 @@ class DRR(Cusp):
         drr._read(file_name)
         return drr
 
+    def __getstate__(self):
+        # Drop caches holding unpicklable jit closures; they are
+        # rebuilt lazily on first use.
+        state = self.__dict__.copy()
+        state.pop('c_lnnp', None)
+        state.pop('_eval_legendre_inv_cache', None)
+        return state
+
+
+class _Clnnp(vegas.BatchIntegrand):
+    r"""
+    The :math:`|\mathcal{C}_{\ell n n^{\prime}}|^{2}` batch integrand for a
+    single :math:`j` grid point. A picklable class so `vegas` can ship it
+    to its worker processes when ``nproc > 1``.
+    """
+
+    def __init__(self, drr, j, get_jf, lnnp):
+        self.drr = drr
+        self.j = j
+        self.get_jf = get_jf
+        self.lnnp = lnnp
+        self._scratch = None
+
+    def __call__(self, x):
+        # a single contiguous pass over the batch; the kernel masks the
+        # non-resonant samples itself, so no fancy-indexed gather/scatter
+        true_anomaly = x[:, :-1].T * np.pi
+        sma_f = self.drr.inverse_cumulative_a(x[:, -1])
+        jf = self.get_jf(sma_f)
+        # reuse one scratch buffer across batches instead of allocating
+        # a fresh result array every call
+        if self._scratch is None or self._scratch.size < sma_f.size:
+            self._scratch = np.empty(sma_f.size)
+        return self.drr._integrand(self.j, sma_f, jf, self.lnnp,
+                                   true_anomaly,
+                                   out=self._scratch[:sma_f.size])
+
+
+# The `DRR` instance the pool workers operate on. Set before the pool is
+# forked so the workers inherit the precomputed interpolation grids.
+_parallel_drr = None
+
+
+class _ClnnpVector(vegas.BatchIntegrand):
+    r"""
+    Vector-valued batch integrand evaluating the
+    :math:`|\mathcal{C}_{\ell n n^{\prime}}|^{2}` integrand for every
+    :math:`j` grid point at once. The sampled field-star semi-major axis
+    and true anomalies are computed once per batch and shared across the
+    grid.
+    """
+
+    def __init__(self, drr, get_jfs, lnnp):
+        self.drr = drr
+        self.get_jfs = get_jfs
+        self.lnnp = lnnp
+        self._scratch = None
+        self._out = None
+
+    def __call__(self, x):
+        true_anomaly = x[:, :-1].T * np.pi
+        sma_f = self.drr.inverse_cumulative_a(x[:, -1])
+        # the non-resonant columns stay zero for the whole session, so
+        # the reused output buffer only needs zeroing when (re)allocated
+        if self._out is None or self._out.shape[0] < x.shape[0]:
+            self._out = np.zeros((x.shape[0], self.drr.j.size))
+            self._scratch = np.empty(x.shape[0])
+        out = self._out[:x.shape[0]]
+        scratch = self._scratch[:sma_f.size]
+        for k, (j, get_jf) in enumerate(zip(self.drr.j, self.get_jfs)):
+            if get_jf is None:
+                continue
+            jf = get_jf(sma_f)
+            out[:, k] = self.drr._integrand(j, sma_f, jf, self.lnnp,
+                                            true_anomaly, out=scratch)
+        return out
+
 
-def integrate(func, integ, neval=1e4):
-    integ(func, nitn=10, neval=neval)
-    result = integ(func, nitn=10, neval=neval)
+def _canonical_ratio(lnnp):
+    r"""
+    The resonance ratio :math:`n/n^{\prime}` as an exact rational, used
+    as the cache key for the resonance interpolation grids.
+    """
+    l, n, n_p = lnnp
+    return Fraction(int(n), int(n_p))
+
+
+def _drr_worker(args):
+    r"""
+    Evaluate a single :math:`j` grid point on a forked pool worker.
+    """
+    j, omega, seed, lnnp, neval, nproc, beta, tr_map = args
+    return _parallel_drr._drr(j, omega, lnnp, neval=neval, seed=seed,
+                              nproc=nproc, beta=beta, tr_map=tr_map)
+
+
+def integrate(func, integ, neval=1e4, nproc=1, nitn_warmup=5, adapt=True):
+    r"""
+    Integrate `func` with `integ`, adapting the importance map and the
+    stratification on a short warm-up pass before the measurement pass.
+
+    With ``adapt=False`` the map is frozen during the measurement pass,
+    which makes the iteration estimates statistically independent and
+    the chi^2 unbiased, at the price of measuring with the warm-up
+    quality map: on the resonance integrands here this inflates the
+    errors several-fold at fixed `neval`, so the adaptive measurement
+    remains the default.
+    """
+    integ(func, nitn=nitn_warmup, neval=max(neval // 4, 100), nproc=nproc)
+    result = integ(func, nitn=10, neval=neval, nproc=nproc, adapt=adapt)
     try:
         res, err = np.array([[r.val, np.sqrt(r.var)] for r in result]).T
     except TypeError:
@@ -330,24 +537,131 @@ def integrate(func, integ, neval=1e4):
     return res, err
 
 
-@jit(nopython=True)
-def a2_integrand(sma, j, sma_p, j_p, lnnp, true_anomaly):
+def a2_integrand(sma, j, sma_p, j_p, lnnp, true_anomaly, out=None):
     r"""
     Returns the :math:`|a_{\ell n n^{\prime}}|^{2}` integrand to use in the MC integration
+
+    `out`, when given, is used as the output buffer so callers can reuse
+    a scratch array across batches.
     """
-    l, n, n_p = lnnp
-    cnnp = np.cos(true_anomaly.T * np.array([n, n, n_p, n_p])).T
-    cnnp = cnnp[0] * cnnp[1] * cnnp[2] * cnnp[3]
-    j2 = j ** 2
-    j_p2 = j_p ** 2
-    ecc, eccp = np.sqrt(1 - j2), np.sqrt(1 - j_p2)
-    r12 = (sma * j2 / (1 - ecc * np.cos(true_anomaly[:2])))
-    rp12 = (sma_p * j_p2 / (1 - eccp * np.cos(true_anomaly[2:])))
-    r_1, r_2 = r12[0], r12[-1]
-    rp1, rp2 = rp12[0], rp12[-1]
-    return (cnnp / j2 / j_p2 / sma ** 2 / sma_p ** 4 *
-            (np.minimum(r_1, rp1) * np.minimum(r_2, rp2)) ** (2 * l + 1) /
-            (r_1 * r_2 * rp1 * rp2) ** (l - 1))
+    if out is None:
+        out = np.empty(sma_p.size)
+    _a2_kernel(lnnp)(sma, j, sma_p, j_p, true_anomaly, out)
+    return out
+
+
+@njit(fastmath=True, cache=True)
+def _int_pow(x, k):
+    r"""
+    :math:`x^{k}` for a non-negative integer :math:`k` via the binary
+    multiply ladder (square-and-multiply) instead of a generic
+    float `pow`. With `k` a compile-time constant, as in the
+    specialized kernels, the loop unrolls to straight multiplies.
+    """
+    r = x if k & 1 else 1.0
+    k >>= 1
+    while k:
+        x = x * x
+        if k & 1:
+            r = r * x
+        k >>= 1
+    return r
+
+
+@njit(fastmath=True, cache=True)
+def _cos_n(c, k):
+    r"""
+    :math:`\cos(k \theta)` from :math:`c = \cos(\theta)` via the
+    Chebyshev recurrence :math:`T_{k} (c) = 2 c T_{k-1} (c) - T_{k-2} (c)`
+    """
+    if k == 0:
+        return 1.0
+    t0 = 1.0
+    t1 = c
+    for _ in range(k - 1):
+        t0, t1 = t1, 2 * c * t1 - t0
+    return t1
+
+
+_a2_kernel_cache = {}
+
+
+def _a2_kernel(lnnp):
+    r"""
+    Returns the fused elementwise kernel of the
+    :math:`|a_{\ell n n^{\prime}}|^{2}` integrand, specialized for
+    :math:`(\ell, n, n^{\prime})`. The tuple is constant for an entire
+    `vegas` session, so the orders and the integer power exponents are
+    baked in as compile-time constants (numba constant-folds them and
+    unrolls the Chebyshev recurrence); compiled kernels are reused via a
+    module-level cache.
+    """
+    try:
+        return _a2_kernel_cache[lnnp]
+    except KeyError:
+        pass
+
+    l, n, n_p = (int(k) for k in lnnp)
+    n_p_abs = abs(n_p)
+    p_min = 2 * l + 1
+    p_r = l - 1
+
+    @njit(parallel=True, fastmath=True)
+    def kernel(sma, j, sma_p, j_p, true_anomaly, out):
+        # the test-star factors are constant over the whole batch:
+        # hoist the eccentricity, the semi-latus rectum a(1 - e^2) and
+        # the normalization out of the per-sample loop
+        j2 = j * j
+        ecc = np.sqrt(1 - j2)
+        sma_j2 = sma * j2
+        sma2 = sma * sma
+        for i in prange(out.size):
+            # branchless: points outside the resonant domain (j_p <= 0)
+            # are evaluated at a harmless clamp value and masked out at
+            # the end, so the loop body is straight-line code the LLVM
+            # vectorizer can turn into SIMD instead of bailing out on an
+            # early exit
+            resonant = j_p[i] > 0
+            jp = j_p[i] if resonant else 0.5
+            # the base cosines are shared between the resonant phase
+            # factor (through the Chebyshev recurrence) and the orbital
+            # radii
+            c_1 = np.cos(true_anomaly[0, i])
+            c_2 = np.cos(true_anomaly[1, i])
+            c_p1 = np.cos(true_anomaly[2, i])
+            c_p2 = np.cos(true_anomaly[3, i])
+            j_p2 = jp * jp
+            eccp = np.sqrt(1 - j_p2)
+            cnnp = (_cos_n(c_1, n) * _cos_n(c_2, n) *
+                    _cos_n(c_p1, n_p_abs) * _cos_n(c_p2, n_p_abs))
+            r_1 = sma_j2 / (1 - ecc * c_1)
+            r_2 = sma_j2 / (1 - ecc * c_2)
+            rp1 = sma_p[i] * j_p2 / (1 - eccp * c_p1)
+            rp2 = sma_p[i] * j_p2 / (1 - eccp * c_p2)
+            out[i] = resonant * (cnnp / j2 / j_p2
+                                 / sma2 / sma_p[i] ** 4 *
+                                 _int_pow(min(r_1, rp1) * min(r_2, rp2),
+                                          p_min) /
+                                 _int_pow(r_1 * r_2 * rp1 * rp2, p_r))
+
+    _a2_kernel_cache[lnnp] = kernel
+    return kernel
+
+
+@lru_cache()
+def _abs_sph_harm_sq(l, m):
+    r"""
+    :math:`|Y_{\ell}^{m} (\pi/2, 0)|^{2}`
+
+    Cached per :math:`(\ell, m)` since the same factor is shared by all
+    the :math:`(n, n^{\prime})` pairs of a given :math:`\ell`.
+    """
+    try:
+        y_lm = special.sph_harm_y(l, m, np.pi / 2, 0.0)
+    except AttributeError:
+        # scipy < 1.15
+        y_lm = special.sph_harm(m, l, 0.0, np.pi / 2)
+    return abs(y_lm) ** 2
 
 
 @lru_cache()
@@ -356,11 +670,33 @@ def _a2_norm_factor(l, n, n_p):
     Normalization factor for :math:`|a_{\ell n n^{prime}} |^{2}`
     """
 
-    return (abs(special.sph_harm(n, l, 0, np.pi / 2)) ** 2 *
-            abs(special.sph_harm(n_p, l, 0, np.pi / 2)) ** 2 *
+    return (_abs_sph_harm_sq(l, n) * _abs_sph_harm_sq(l, n_p) *
             (4 * np.pi / (2 * l + 1)) ** 2) / (2 * l + 1)
 
 
+class _JfInterp(object):
+    r"""
+    Interpolates :math:`j^{\prime} (a^{\prime})` over a log-spaced
+    :math:`a^{\prime}` grid. A picklable replacement for a lambda closure.
+
+    The :math:`j^{\prime}` values are in :math:`[0, 1]` and are stored
+    as contiguous float32 to halve the memory traffic of the table
+    lookups; the :math:`\log a^{\prime}` grid keeps full precision for
+    the binary search.
+    """
+
+    def __init__(self, log_ap, jp):
+        self.log_ap = np.ascontiguousarray(log_ap)
+        self.jp = np.ascontiguousarray(jp, dtype=np.float32)
+
+    def __call__(self, af):
+        af = np.asarray(af, dtype=float)
+        if af.ndim == 0:
+            return interp_sorted_semilogx(af.reshape(1), self.log_ap,
+                                          self.jp)[0]
+        return interp_sorted_semilogx(af, self.log_ap, self.jp)
+
+
 class ResInterp(object):
     r"""
     Generates an interpolation function :math:`j^{\prime} (a^{\prime})` where :math:`j^{\prime}`
@@ -382,7 +718,7 @@ class ResInterp(object):
     >>> omega = cusp.nu_p(a=0.1, j=j)
     >>> resint = ResInterp(cusp, omega)
     >>> jf = np.array([resint(o)(0.1) for o in omega])
-    >>> abs(1 - jf/j).max() < 1e-4
+    >>> bool(abs(1 - jf/j).max() < 1e-4)
     True
     """
 
@@ -398,21 +734,44 @@ class ResInterp(object):
                                1001)[1:]
         self.x = np.logspace(-5, 0, self.size + 1)[:-1][::-1]
         self.j_grid = self.make_grid()
+        # one interpolant per omega, built once; __call__ is a pure
+        # dict lookup
+        self._intrp = dict(
+            (omega, _JfInterp(log_ap, jp) if jp.size > 0 else None)
+            for omega, (log_ap, jp) in self.j_grid.items())
 
     def __call__(self, omega):
-        log_ap, jp = self.j_grid[omega]
-        if jp.size == 0:
-            return
-        return lambda af: np.interp(np.log(af), log_ap, jp, left=0, right=0)
+        return self._intrp[omega]
 
     def make_grid(self):
-        j_grid = []
-        for af in self._af:
-            jlc = self._cusp.jlc(af)
-            j = (1 - jlc) * self.x + jlc
-            nup = self._cusp.nu_p(af, j)
-            j_grid.append(np.exp(np.interp(self.omega, nup, np.log(j),
-                                           left=-np.inf, right=-np.inf)))
-        j_grid = np.array(list(zip(*j_grid)))
+        # evaluate the precession frequency on the full (af, j) grid in
+        # one broadcast call instead of one call per af row
+        jlc = self._cusp.jlc(self._af)[:, None]
+        j = (1 - jlc) * self.x + jlc
+        nup = self._cusp.nu_p(self._af[:, None], j)
+        log_j = np.log(j)
+        omega = np.atleast_1d(np.asarray(self.omega, dtype=float))
+        # nup is ascending along the j axis, so all the per-row interp
+        # calls collapse into one batched bracketing: count the grid
+        # values below each omega, gather the bracketing pair and blend.
+        # The count runs in chunks of omega to bound the boolean
+        # temporary at ~16 MB instead of the full
+        # (af.size, j.size, omega.size) cube.
+        idx = np.empty((nup.shape[0], omega.size), dtype=np.intp)
+        chunk = max(1, 2 ** 24 // nup.size)
+        for k in range(0, omega.size, chunk):
+            idx[:, k:k + chunk] = (nup[:, :, None]
+                                   < omega[k:k + chunk]).sum(axis=1)
+        lo = np.clip(idx - 1, 0, nup.shape[1] - 1)
+        hi = np.clip(idx, 0, nup.shape[1] - 1)
+        x_lo = np.take_along_axis(nup, lo, axis=1)
+        x_hi = np.take_along_axis(nup, hi, axis=1)
+        y_lo = np.take_along_axis(log_j, lo, axis=1)
+        y_hi = np.take_along_axis(log_j, hi, axis=1)
+        inside = (idx > 0) & (idx < nup.shape[1])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w = (omega - x_lo) / (x_hi - x_lo)
+            j_grid = np.where(inside, y_lo * (1 - w) + y_hi * w, -np.inf)
+        j_grid = np.exp(j_grid).T
         return dict((omega, (np.log(self._af[j > 0]), j[j > 0]))
                     for omega, j in zip(self.omega, j_grid))
@@ -1,6 +1,7 @@
 import numpy as np
 from numba import float64
 from numba import guvectorize
+from numba import njit
 from numba import vectorize
 
 
@@ -84,6 +85,41 @@ def interp_reg_semilogx_vec(x, f, log=np.log):
     return _interp_reg
 
 
+@njit(cache=True)
+def interp_sorted_semilogx(x_intp, log_x, f):
+    """
+    Linear interpolation of f over a sorted, irregular logarithmic grid
+    via binary search. Points outside the grid evaluate to 0.
+
+    Parameters
+    ----------
+    x_intp : array
+      points to interpolate at (in linear scale)
+    log_x : array
+      sorted grid (in log scale)
+    f : array
+
+    :return: the interpolated values
+    """
+    res = np.empty(x_intp.size)
+    for i in range(x_intp.size):
+        xi = np.log(x_intp[i])
+        if xi < log_x[0] or xi > log_x[-1]:
+            res[i] = 0.0
+            continue
+        lo = 0
+        hi = log_x.size - 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if log_x[mid] <= xi:
+                lo = mid
+            else:
+                hi = mid
+        w = (xi - log_x[lo]) / (log_x[hi] - log_x[lo])
+        res[i] = f[lo] * (1 - w) + f[hi] * w
+    return res
+
+
 @guvectorize([(float64[:], float64[:], float64, float64, float64[:])],
              '(n),(m),(),()->(n)')
 def interp_reg_semilogx(x_intp, f, x0, x1, res):
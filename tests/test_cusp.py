@@ -41,6 +41,23 @@ def test_gp(tol=1e-3):
     assert abs(1 - gp / gp2).max() < tol
 
 
+def test_nu_p_broadcast():
+    cusp = Cusp(gamma=1.75)
+    a = np.logspace(-3, 0, 7)
+    j = np.logspace(-2, 0, 5)[:-1]
+
+    # (a, j) grids broadcast to a full 2-d evaluation
+    nup = cusp.nu_p(a[:, None], j)
+    assert nup.shape == (a.size, j.size)
+    scalar = np.array([[cusp.nu_p(ai, ji) for ji in j] for ai in a])
+    np.testing.assert_allclose(nup, scalar)
+
+    d_nup = cusp.d_nu_p(a[:, None], j)
+    assert d_nup.shape == (a.size, j.size)
+    scalar = np.array([[cusp.d_nu_p(ai, ji) for ji in j] for ai in a])
+    np.testing.assert_allclose(d_nup, scalar)
+
+
 def test_period(tol=0.4):
     # S2 period
     cusp = Cusp(mbh_mass=4.35e6)
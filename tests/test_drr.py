@@ -6,20 +6,20 @@ from scrrpy.drr import ResInterp
 SEED = 51806469
 
 D_VALUES = np.array(
-    [1.75752701e-13, 4.48444715e-13, 1.10896626e-12,
-     2.69628144e-12, 6.49855385e-12, 1.53897978e-11,
-     3.53079070e-11, 7.95060658e-11, 1.74356982e-10,
-     3.78702632e-10, 7.62428563e-10, 1.22869756e-08,
-     7.80248648e-09, 1.01290011e-08, 9.44420166e-09,
-     6.57582445e-09])
+    [1.73109299e-13, 4.45043301e-13, 1.09554199e-12,
+     2.65578237e-12, 6.41902996e-12, 1.51866017e-11,
+     3.54506451e-11, 7.90900164e-11, 1.71428581e-10,
+     3.75784555e-10, 7.65179799e-10, 1.22240440e-08,
+     7.87521765e-09, 9.69627338e-09, 9.33273267e-09,
+     6.47253518e-09])
 
 D_ERRORS = np.array(
-    [8.73116429e-16, 2.26774809e-15, 5.34871809e-15,
-     1.24663177e-14, 2.65481855e-14, 5.80360553e-14,
-     1.30039735e-13, 2.86358234e-13, 5.78693261e-13,
-     1.51284370e-12, 2.23531062e-12, 4.91059215e-11,
-     1.30024470e-11, 2.55114407e-11, 3.96599494e-11,
-     4.63296323e-11])
+    [7.64777177e-16, 1.91342338e-15, 5.11627752e-15,
+     1.23851327e-14, 2.89107399e-14, 6.92500991e-14,
+     1.72715174e-13, 3.97456969e-13, 9.25972577e-13,
+     2.00955661e-12, 4.40633054e-12, 3.80164103e-11,
+     1.79835677e-11, 7.35860897e-11, 8.12220416e-11,
+     1.27689063e-10])
 
 
 def test_io():
@@ -57,6 +57,19 @@ def test_drr(tol=0.1):
     assert abs(1 - d_err / D_ERRORS).max() < tol
 
 
+def test_drr_batched():
+    j_grid_size = 8
+    drr1 = DRR(0.1, j_grid_size=j_grid_size, seed=SEED)
+    d1, d1_err = drr1(2, neval=1000, batched=True, progress_bar=False)
+    assert d1.size == j_grid_size
+    assert np.isfinite(d1).all()
+    assert (d1 >= 0).all(), d1.min()
+    drr2 = DRR(0.1, j_grid_size=j_grid_size, seed=SEED)
+    d2, d2_err = drr2(2, neval=1000, batched=True, progress_bar=False)
+    np.testing.assert_array_almost_equal_nulp(d1, d2)
+    np.testing.assert_array_almost_equal_nulp(d1_err, d2_err)
+
+
 def test_res_int(tol=5e-2):
     drr = DRR(0.1)
     jlc = drr.jlc(drr.sma)
@@ -4,6 +4,7 @@ from scrrpy.utils import interp_reg
 from scrrpy.utils import interp_reg_loglog
 from scrrpy.utils import interp_reg_semilogx
 from scrrpy.utils import interp_reg_semilogx_vec
+from scrrpy.utils import interp_sorted_semilogx
 
 
 def test_interp_reg(tol=1e-4):
@@ -31,6 +32,16 @@ def test_interp_reg_semilogx_vec(tol=1e-3):
     assert err < tol, err
 
 
+def test_interp_sorted_semilogx(tol=1e-3):
+    x = np.sort(10**((1 - 2*np.random.rand(1000))*5))
+    x_intp = 10**((1 - 2*np.random.rand(1000))*4)
+    y = np.log(x)**2
+    f_intp = interp_sorted_semilogx(x_intp, np.log(x), y)
+    f_ref = np.interp(np.log(x_intp), np.log(x), y, left=0, right=0)
+    err = max(abs(f_ref - f_intp))
+    assert err < tol, err
+
+
 def test_interp_reg_loglog(tol=1e-3):
     x = np.logspace(-5, 5, 1000)
     x_intp = 10**((1 - 2*np.random.rand(1000))*5)